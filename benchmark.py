@@ -0,0 +1,227 @@
+# benchmark.py
+#
+# Đo hiệu năng các đường import của DatabaseManager.
+# Chạy với DATABASE_URL trỏ tới database test (mọi thao tác ghi đều được rollback),
+# hoặc không đặt DATABASE_URL để đo trên SQLite nhúng (SQLITE_PATH):
+#
+#     DATABASE_URL=postgresql://... python benchmark.py upsert --rows 100000
+#     SQLITE_PATH=/tmp/bench.db python benchmark.py upsert --rows 100000
+#     python benchmark.py formats --rows 100000
+#     python benchmark.py excel --rows 10000 100000
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import text
+
+import main
+
+
+def make_rows(n_rows, prefix="BENCH"):
+    """Tạo DataFrame giả lập đã qua bước lọc (_prepare_import_frame)"""
+    created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return pd.DataFrame({
+        "KHÁCH HÀNG": [f"Khách hàng {i % 50}" for i in range(n_rows)],
+        "ĐƠN HÀNG": [f"{prefix}-{i // 20:06d}" for i in range(n_rows)],
+        "MÃ HÀNG": [f"MH{i:08d}" for i in range(n_rows)],
+        "KÍCH THƯỚC": ["D80xH90mm"] * n_rows,
+        "MÀU": ["White"] * n_rows,
+        "HƯƠNG LIỆU": [f"F25-{i % 300:04d}" for i in range(n_rows)],
+        "BẤC": [""] * n_rows,
+        "NGÀY_TẠO": [created_at] * n_rows,
+    })
+
+
+def time_write(db, write_fn, df):
+    """Chạy write_fn trong một transaction rồi rollback, trả về số giây"""
+    with db.engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            start = time.perf_counter()
+            write_fn(conn, df)
+            elapsed = time.perf_counter() - start
+        finally:
+            trans.rollback()
+    return elapsed
+
+
+# Bảng "data" phẳng của phiên bản gốc (trước khi chuẩn hóa), tạo tạm trong transaction của benchmark
+BASELINE_TABLE_QUERY = """
+CREATE TEMP TABLE "bench_baseline_data" (
+    "KHÁCH HÀNG" VARCHAR(255),
+    "ĐƠN HÀNG" VARCHAR(255),
+    "MÃ HÀNG" VARCHAR(255),
+    "KÍCH THƯỚC" VARCHAR(100),
+    "BẤC" VARCHAR(100),
+    "MÀU" VARCHAR(100),
+    "HƯƠNG LIỆU" VARCHAR(255),
+    "NGÀY_TẠO" TIMESTAMP,
+    PRIMARY KEY ("ĐƠN HÀNG", "MÃ HÀNG")
+)
+"""
+BASELINE_UPSERT_QUERY = """
+INSERT INTO "bench_baseline_data" ("KHÁCH HÀNG", "ĐƠN HÀNG", "MÃ HÀNG", "KÍCH THƯỚC", "MÀU", "HƯƠNG LIỆU", "BẤC", "NGÀY_TẠO")
+VALUES (:kh, :dh, :mh, :kt, :mau, :hl, :bac, :nt)
+ON CONFLICT ("ĐƠN HÀNG", "MÃ HÀNG") DO UPDATE
+SET
+    "KHÁCH HÀNG" = EXCLUDED."KHÁCH HÀNG",
+    "KÍCH THƯỚC" = EXCLUDED."KÍCH THƯỚC",
+    "MÀU" = EXCLUDED."MÀU",
+    "HƯƠNG LIỆU" = EXCLUDED."HƯƠNG LIỆU",
+    "BẤC" = EXCLUDED."BẤC",
+    "NGÀY_TẠO" = EXCLUDED."NGÀY_TẠO"
+"""
+
+
+def write_baseline(conn, df):
+    """Đường ghi gốc: dựng tham số từng dòng bằng iterrows rồi executemany INSERT ... ON CONFLICT"""
+    conn.execute(text(BASELINE_TABLE_QUERY))
+    data_to_insert = []
+    for _, row in df.iterrows():
+        data_to_insert.append({
+            "kh": row.get("KHÁCH HÀNG", ""),
+            "dh": row.get("ĐƠN HÀNG", ""),
+            "mh": row.get("MÃ HÀNG", ""),
+            "kt": row.get("KÍCH THƯỚC", ""),
+            "mau": row.get("MÀU", ""),
+            "hl": row.get("HƯƠNG LIỆU", ""),
+            "bac": row.get("BẤC", ""),
+            "nt": row.get("NGÀY_TẠO", ""),
+        })
+    conn.execute(text(BASELINE_UPSERT_QUERY), data_to_insert)
+
+
+def bench_upsert(args):
+    """
+    So sánh đường ghi gốc (executemany ON CONFLICT từng dòng vào bảng phẳng) với staging + merge.
+    SQLite không có COPY (_write_rows luôn nạp staging bằng executemany) nên chỉ đo một arm staging.
+    """
+    db = main.create_database_manager()
+    if db.engine is None:
+        raise SystemExit("Không kết nối được database")
+
+    arms = [("baseline", write_baseline)]
+    if isinstance(db, main.SQLiteDatabaseManager):
+        print("SQLite: không có COPY, chỉ so sánh baseline với staging (executemany) + merge")
+        arms.append(("executemany", db._write_rows))
+    else:
+        for method in ["executemany", "copy"]:
+            arms.append((method, lambda conn, df, method=method: db._write_rows(conn, df, method=method)))
+
+    print(f"{'rows':>10} | {'method':<12} | {'seconds':>8} | {'rows/s':>10}")
+    print("-" * 50)
+    for n_rows in args.rows:
+        df = make_rows(n_rows)
+        for label, write_fn in arms:
+            elapsed = time_write(db, write_fn, df)
+            print(f"{n_rows:>10} | {label:<12} | {elapsed:>8.2f} | {n_rows / elapsed:>10.0f}")
+
+
+def write_format_files(n_rows, directory):
+    """Ghi cùng một bộ dữ liệu ra các định dạng import, trả về {format: đường dẫn}"""
+    from openpyxl import Workbook
+
+    df = make_rows(n_rows).drop(columns=["BẤC", "NGÀY_TẠO"])
+    # Bố cục theo vị trí giống file xuất từ ERP: cột A/B/G/M/Y/AB, các cột khác để trống
+    width = max(main.excel_col_to_index(src) for src, _ in main.IMPORT_COLUMN_MAP) + 1
+    positional = pd.DataFrame("", index=df.index, columns=range(width))
+    for src, dst in main.IMPORT_COLUMN_MAP:
+        positional[main.excel_col_to_index(src)] = df[dst]
+
+    paths = {}
+    paths["xlsx"] = os.path.join(directory, "bench.xlsx")
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append([f"COL{i}" for i in range(width)])
+    for row in positional.itertuples(index=False):
+        ws.append(list(row))
+    wb.save(paths["xlsx"])
+
+    paths["csv"] = os.path.join(directory, "bench.csv")
+    df.to_csv(paths["csv"], index=False)
+
+    paths["parquet"] = os.path.join(directory, "bench.parquet")
+    df.to_parquet(paths["parquet"], compression="zstd")
+
+    paths["ndjson"] = os.path.join(directory, "bench.ndjson")
+    df.to_json(paths["ndjson"], orient="records", lines=True, force_ascii=False)
+    return paths
+
+
+def bench_formats(args):
+    """Đo thời gian đọc + chuẩn hóa/kiểm tra (không ghi DB) cho từng định dạng"""
+    created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    print(f"{'rows':>10} | {'format':<8} | {'size MB':>8} | {'seconds':>8} | {'rows/s':>10}")
+    print("-" * 58)
+    for n_rows in args.rows:
+        with tempfile.TemporaryDirectory() as directory:
+            paths = write_format_files(n_rows, directory)
+            for fmt, path in paths.items():
+                start = time.perf_counter()
+                valid_rows = 0
+                for df_chunk in main.IMPORT_READERS[fmt](path, main.IMPORT_CHUNK_SIZE):
+                    df_valid, _ = main.db_manager._prepare_import_frame(df_chunk, created_at)
+                    valid_rows += len(df_valid)
+                elapsed = time.perf_counter() - start
+                assert valid_rows == n_rows, (fmt, valid_rows)
+                size_mb = os.path.getsize(path) / (1024 * 1024)
+                print(f"{n_rows:>10} | {fmt:<8} | {size_mb:>8.2f} | {elapsed:>8.2f} | {n_rows / elapsed:>10.0f}")
+
+
+def bench_excel(args):
+    """
+    So sánh engine đọc Excel (openpyxl / calamine) qua read_excel_frame trên data/data.xlsx và file giả lập.
+    Dòng "stream" là đường import iter_excel_chunks (luôn đọc bằng openpyxl read-only, không phụ thuộc
+    EXCEL_ENGINE), chỉ để đối chiếu.
+    """
+    workbooks = [("data/data.xlsx", "data/data.xlsx")] if os.path.exists("data/data.xlsx") else []
+    with tempfile.TemporaryDirectory() as directory:
+        for n_rows in args.rows:
+            path = write_format_files(n_rows, directory)["xlsx"]
+            synthetic = os.path.join(directory, f"bench_{n_rows}.xlsx")
+            os.rename(path, synthetic)
+            workbooks.append((f"synthetic {n_rows} rows", synthetic))
+
+        engines = ["openpyxl"] + (["calamine"] if main.CalamineWorkbook is not None else [])
+        print(f"{'workbook':<24} | {'reader':<20} | {'rows':>8} | {'seconds':>8}")
+        print("-" * 70)
+        for label, path in workbooks:
+            for engine in engines:
+                main.EXCEL_ENGINE = engine
+                start = time.perf_counter()
+                rows = len(main.read_excel_frame(path, header=None, skiprows=1))
+                elapsed = time.perf_counter() - start
+                print(f"{label:<24} | {'read_excel ' + engine:<20} | {rows:>8} | {elapsed:>8.2f}")
+
+            start = time.perf_counter()
+            rows = sum(len(df) for df in main.iter_excel_chunks(path))
+            elapsed = time.perf_counter() - start
+            print(f"{label:<24} | {'stream openpyxl':<20} | {rows:>8} | {elapsed:>8.2f}")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Benchmark import pipeline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_upsert = sub.add_parser("upsert", help="So sánh upsert gốc với staging table (executemany / COPY) + merge")
+    p_upsert.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    p_upsert.set_defaults(func=bench_upsert)
+
+    p_formats = sub.add_parser("formats", help="So sánh tốc độ đọc xlsx / csv / parquet / ndjson")
+    p_formats.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    p_formats.set_defaults(func=bench_formats)
+
+    p_excel = sub.add_parser("excel", help="So sánh engine đọc Excel openpyxl và calamine")
+    p_excel.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    p_excel.set_defaults(func=bench_excel)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main_cli()
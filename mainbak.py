@@ -53,6 +53,26 @@ def excel_col_to_index(col):
     return index - 1  # Vì index bắt đầu từ 0
 
 
+# Engine đọc Excel: "auto" (calamine nếu đã cài python-calamine), "calamine" hoặc "openpyxl"
+EXCEL_ENGINE = os.environ.get("EXCEL_ENGINE", "auto").lower()
+
+
+def read_excel_fast(file_path, **kwargs):
+    """pd.read_excel dùng calamine khi có thể, tự fallback về openpyxl"""
+    engines = ["openpyxl"] if EXCEL_ENGINE == "openpyxl" else ["calamine", "openpyxl"]
+    for engine in engines:
+        try:
+            return pd.read_excel(file_path, engine=engine, **kwargs)
+        except ImportError:
+            if engine == engines[-1]:
+                raise
+            continue  # python-calamine chưa được cài
+        except Exception as e:
+            if engine == "openpyxl":
+                raise
+            logger.warning(f"calamine không đọc được {file_path}, chuyển sang openpyxl: {e}")
+
+
 class DataManager:
     def __init__(self):
         self.data_file = DATA_FILE
@@ -70,7 +90,7 @@ class DataManager:
     def load_data(self):
         try:
             if os.path.exists(self.data_file):
-                df = pd.read_excel(self.data_file)
+                df = read_excel_fast(self.data_file)
                 df = df.fillna("")
                 logger.info(f"Đã load {len(df)} dòng dữ liệu")
                 return df
@@ -92,7 +112,7 @@ class DataManager:
         try:
             # Đọc file bắt đầu từ dòng thứ 2 (bỏ qua dòng tiêu đề)
             # header=None: không dùng dòng nào làm header, skiprows=1: bỏ qua dòng đầu tiên
-            df_new = pd.read_excel(file_path, header=None, skiprows=1).fillna("")
+            df_new = read_excel_fast(file_path, header=None, skiprows=1).fillna("")
 
             logger.info(f"Đọc được {len(df_new)} dòng dữ liệu từ file import (bắt đầu từ dòng thứ 2)")
 